@@ -141,8 +141,7 @@ class BlockRecord(DXFEntity):
         db = self.entitydb
         db.delete_entity(self.block)
         db.delete_entity(self.endblk)
-        for entity in self.entity_space:
-            db.delete_entity(entity)
+        db.delete_entities(self.entity_space)
         # remove attributes to find invalid access after death
         del self.block
         del self.endblk
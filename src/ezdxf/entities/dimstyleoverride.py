@@ -1,6 +1,6 @@
 # Copyright (c) 2019 Manfred Moitzi
 # License: MIT License
-from typing import Any, TYPE_CHECKING, Tuple
+from typing import Any, TYPE_CHECKING, Tuple, Iterable, Dict
 from ezdxf.lldxf import const
 from ezdxf.lldxf.const import DXFAttributeError, DIMJUST, DIMTAD
 from ezdxf.math import Vector
@@ -67,6 +67,27 @@ class DimStyleOverride:
                 result = default
         return result
 
+    def bulk_get(self, attributes: Iterable[str]) -> Dict[str, Any]:
+        """ Returns all existing DIMSTYLE `attributes` from override dict :attr:`dimstyle_attribs` or base
+        :class:`DimStyle` as dict in one pass, attributes which do not exist or are not supported are not included.
+        Use ``dict.get(attribute, default)`` on the result for the same results as :meth:`get`.
+
+        """
+        overrides = self.dimstyle_attribs
+        dimstyle_get = self.dimstyle.dxf.get
+        result = dict()
+        for attribute in attributes:
+            if attribute in overrides:
+                result[attribute] = overrides[attribute]
+            else:
+                try:
+                    value = dimstyle_get(attribute, None)
+                except DXFAttributeError:
+                    continue
+                if value is not None:
+                    result[attribute] = value
+        return result
+
     def pop(self, attribute: str, default: Any = None) -> Any:
         """ Returns DIMSTYLE `attribute` from override dict :attr:`dimstyle_attribs` and removes this `attribute`
         from override dict.
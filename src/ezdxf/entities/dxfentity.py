@@ -4,6 +4,7 @@
 # DXFEntity - Root Entity
 from typing import TYPE_CHECKING, List, Any, Iterable, Optional, Union, Type, TypeVar
 import copy
+import sys
 from ezdxf import options
 from ezdxf.lldxf.types import handle_code, dxftag, cast_value
 from ezdxf.lldxf.tags import Tags
@@ -71,6 +72,11 @@ class DXFNamespace:
             handle = base_class_.get_first_value(code, None)
             # owner is None if loaded from DXF R12 file
             owner = base_class_.get_first_value(330, None)
+            # interned handles are shared by all entities with the same owner and by the entity database
+            if handle is not None:
+                handle = sys.intern(handle)
+            if owner is not None:
+                owner = sys.intern(owner)
             self.rewire(entity, handle, owner)
         else:
             self.reset_handles()
@@ -285,15 +291,19 @@ class SubclassProcessor:
         # Exception CLASS has also only one subclass and no subclass marker, handled as DXF R12 entity
         self.r12 = (dxfversion == DXF12) or (len(self.subclasses) == 1)
         self.name = tags.dxftype()
-        try:
-            self.handle = tags.get_handle()
-        except DXFValueError:
-            self.handle = '<?>'
 
     @property
     def base_class(self):
         return self.subclasses[0]
 
+    @property
+    def handle(self) -> str:
+        """ Returns handle of processed entity or ``'<?>'`` if entity has no handle, only required for logging. """
+        try:
+            return self.base_class.get_handle()
+        except DXFValueError:
+            return '<?>'
+
     def log_unprocessed_tags(self, unprocessed_tags: Iterable, subclass='<?>') -> None:
         if options.log_unprocessed_tags:
             for tag in unprocessed_tags:
@@ -768,7 +778,7 @@ class DXFEntity:
         # 1. tag: (0, DXFTYPE)
         tagwriter.write_tag2(STRUCTURE_MARKER, self.DXFTYPE)
         if tagwriter.dxfversion >= DXF2000:
-            tagwriter.write_tag2(handle_code(self.dxf.dxftype), self.dxf.handle)
+            tagwriter.write_tag2(handle_code(self.DXFTYPE), self.dxf.handle)
             if self.appdata:
                 self.appdata.export_dxf(tagwriter)
             if self.extension_dict:
@@ -778,7 +788,7 @@ class DXFEntity:
             tagwriter.write_tag2(OWNER_CODE, self.dxf.owner)
         else:  # DXF R12
             if tagwriter.write_handles:
-                tagwriter.write_tag2(handle_code(self.dxf.dxftype), self.dxf.handle)
+                tagwriter.write_tag2(handle_code(self.DXFTYPE), self.dxf.handle)
                 # do not write owner handle - not supported by DXF R12
 
     # interface definition
@@ -64,13 +64,7 @@ class EntityFactory:
         return entity.cast() if hasattr(entity, 'cast') else entity
 
     def next_image_key(self, checkfunc=lambda k: True) -> str:
-        while True:
-            key = self.image_key_generator.next()
-            if checkfunc(key):
-                return key
+        return next(filter(checkfunc, self.image_key_generator))
 
     def next_underlay_key(self, checkfunc=lambda k: True) -> str:
-        while True:
-            key = self.underlay_key_generator.next()
-            if checkfunc(key):
-                return key
+        return next(filter(checkfunc, self.underlay_key_generator))
@@ -74,7 +74,7 @@ class Insert(DXFGraphic):
         """ Called by EntityDB.add() """
         for attrib in self.attribs:
             attrib.doc = self.doc  # grant same document
-            self.entitydb.add(attrib)
+        self.entitydb.extend(self.attribs)
         if self.seqend:
             self.seqend.doc = self.doc  # grant same document
             self.entitydb.add(self.seqend)
@@ -343,9 +343,7 @@ class Insert(DXFGraphic):
 
     def delete_all_attribs(self) -> None:
         """ Delete all :class:`Attrib` entities attached to the INSERT entity. """
-        db = self.entitydb
-        for attrib in self.attribs:
-            db.delete_entity(attrib)
+        self.entitydb.delete_entities(self.attribs)
         self.attribs = []
 
     def transform_to_wcs(self, ucs: 'UCS') -> 'Insert':
@@ -102,7 +102,7 @@ class Polyline(DXFGraphic):
         """ Called by Entitydb.add(). (internal API) """
         for vertex in self.vertices:
             vertex.doc = self.doc  # grant same document
-            self.entitydb.add(vertex)
+        self.entitydb.extend(self.vertices)
         if self.seqend:
             self.seqend.doc = self.doc  # grant same document
             self.entitydb.add(self.seqend)
@@ -171,8 +171,7 @@ class Polyline(DXFGraphic):
         Delete all data and references.
 
         """
-        for v in self.vertices:
-            self.entitydb.delete_entity(v)
+        self.entitydb.delete_entities(self.vertices)
         del self.vertices
         self.entitydb.delete_entity(self.seqend)
         super().destroy()
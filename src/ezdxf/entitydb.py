@@ -2,7 +2,8 @@
 # Created: 2019-02-14
 # Copyright (c) 2019-2020, Manfred Moitzi
 # License: MIT License
-from typing import Optional, Iterable, Tuple, TYPE_CHECKING
+from typing import Optional, Iterable, Iterator, Tuple, List, Dict, Set, TYPE_CHECKING
+from collections import defaultdict
 from ezdxf.tools.handle import HandleGenerator
 from ezdxf.lldxf.types import is_valid_handle
 from ezdxf.entities.dxfentity import DXFEntity
@@ -24,7 +25,9 @@ class EntityDB:
     """
 
     def __init__(self):
-        self._database = {}
+        self._database = {}  # type: Dict[str, DXFEntity]
+        # secondary index: dxftype -> set of handles
+        self._dxftype_index = defaultdict(set)  # type: Dict[str, Set[str]]
         self.handles = HandleGenerator()
 
     def __getitem__(self, handle: str) -> DXFEntity:
@@ -37,11 +40,18 @@ class EntityDB:
         assert isinstance(entity, DXFEntity), type(entity)
         if handle == '0' or not is_valid_handle(handle):
             raise ValueError(f'Invalid handle {handle}.')
-        self._database[handle] = entity
+        db = self._database
+        index = self._dxftype_index
+        old_entity = db.get(handle)
+        if old_entity is not None:
+            index[old_entity.dxftype()].discard(handle)
+        db[handle] = entity
+        index[entity.dxftype()].add(handle)
 
     def __delitem__(self, handle: str) -> None:
         """ Delete entity by `handle`. Removes entity only from database, does not destroy the entity. """
-        del self._database[handle]
+        entity = self._database.pop(handle)
+        self._dxftype_index[entity.dxftype()].discard(handle)
 
     def __contains__(self, handle: str) -> bool:
         """ ``True`` if database contains `handle`. """
@@ -52,7 +62,7 @@ class EntityDB:
         """ Count of database items. """
         return len(self._database)
 
-    def __iter__(self) -> Iterable[str]:
+    def __iter__(self) -> Iterator[str]:
         """ Iterable of all handles. """
         return iter(self._database.keys())
 
@@ -60,12 +70,44 @@ class EntityDB:
         """ Returns entity for `handle` or ``None`` if no entry for `handle` exist. """
         return self._database.get(handle)
 
+    def by_dxftype(self, dxftype: str) -> List[DXFEntity]:
+        """ Returns all entities of type `dxftype` like ``'LINE'``, uses an index and does not scan the whole
+        database. The order of the returned entities is undefined.
+
+        """
+        db = self._database
+        return [db[handle] for handle in self._dxftype_index.get(dxftype, ())]
+
+    def count_dxftype(self, dxftype: str) -> int:
+        """ Returns count of entities of type `dxftype` like ``'LINE'``, uses an index and does not scan the whole
+        database.
+
+        """
+        return len(self._dxftype_index.get(dxftype, ()))
+
     def next_handle(self) -> str:
         """ Returns next unique handle."""
-        while True:
+        handle = self.handles.next()
+        if handle in self._database:  # you can not trust $HANDSEED value
+            self._reset_handle_seed()
             handle = self.handles.next()
-            if handle not in self._database:  # you can not trust $HANDSEED value
-                return handle
+        return handle
+
+    def next_handles(self, count: int) -> List[str]:
+        """ Returns `count` next unique handles at once. """
+        handles = self.handles.next_batch(count)
+        db = self._database
+        if any(handle in db for handle in handles):  # you can not trust $HANDSEED value
+            self._reset_handle_seed()
+            handles = self.handles.next_batch(count)
+        return handles
+
+    def _reset_handle_seed(self) -> None:
+        """ Reset handle generator to the next value above the highest existing handle, avoids probing the
+        database handle by handle for an unused handle.
+        """
+        max_handle = max((int(handle, 16) for handle in self._database if is_valid_handle(handle)), default=0)
+        self.handles.reset('%X' % (max_handle + 1))
 
     def keys(self) -> Iterable[str]:
         """ Iterable of all handles. """
@@ -100,11 +142,33 @@ class EntityDB:
         if hasattr(entity, 'add_sub_entities_to_entitydb'):
             entity.add_sub_entities_to_entitydb()
 
+    def extend(self, entities: Iterable[DXFEntity]) -> None:
+        """ Add multiple `entities` to database, see :meth:`add`. """
+        add = self.add
+        new_entities = []
+        # store entities with handles first, reserved handles must not collide with them
+        for entity in entities:
+            if entity.dxf.handle is None and entity.dxftype() not in DATABASE_EXCLUDE:
+                new_entities.append(entity)
+            else:
+                add(entity)
+        if new_entities:
+            # reserve the handles of all new entities in one batch
+            for entity, handle in zip(new_entities, self.next_handles(len(new_entities))):
+                entity.update_handle(handle)
+                add(entity)
+
     def delete_entity(self, entity: DXFEntity) -> None:
         """ Removes `entity` from database and destroys the `entity`. """
         del self[entity.dxf.handle]
         entity.destroy()
 
+    def delete_entities(self, entities: Iterable[DXFEntity]) -> None:
+        """ Removes multiple `entities` from database and destroys them, see :meth:`delete_entity`. """
+        delete_entity = self.delete_entity
+        for entity in entities:
+            delete_entity(entity)
+
     def duplicate_entity(self, entity: DXFEntity) -> DXFEntity:
         """
         Duplicates `entity` and its sub entities (VERTEX, ATTRIB, SEQEND) and store them with new handles in the
@@ -121,8 +185,14 @@ class EntityDB:
 
         """
         new_entity = entity.copy()  # type: DXFEntity
-        new_entity.dxf.handle = self.next_handle()
-        self.add(new_entity)
+        handle = self.next_handle()
+        new_entity.dxf.handle = handle
+        if hasattr(new_entity, 'add_sub_entities_to_entitydb'):
+            # INSERT and POLYLINE: add() also stores the copied ATTRIB, VERTEX and SEQEND entities
+            self.add(new_entity)
+        else:
+            # fast path for entities without sub entities, the new handle is already known
+            self[handle] = new_entity
         return new_entity
 
     def audit(self, auditor: 'Auditor'):
@@ -134,8 +204,8 @@ class EntityDB:
 
         """
         db = self._database
-        remove_handles = []
-        add_entities = []
+        remove_handles = []  # type: List[str]
+        add_entities = []  # type: List[DXFEntity]
         for handle, entity in db.items():
             if not is_valid_handle(handle):
                 auditor.fixed_error(
@@ -150,7 +220,7 @@ class EntityDB:
                 add_entities.append(entity)
 
         for handle in remove_handles:
-            del db[handle]
+            del self[handle]
 
         for entity in add_entities:
             handle = entity.dxf.get('handle')
@@ -32,6 +32,7 @@ class Tags(list):
     stuff.
 
     """
+    __slots__ = ()
 
     @classmethod
     def from_text(cls, text: str) -> 'Tags':
@@ -5,7 +5,7 @@ import math
 from .vector import Vec2
 from .bbox import BoundingBox2d
 from .line import ConstructionLine
-from .construct2d import ConstructionTool, point_to_line_relation
+from .construct2d import ConstructionTool, point_to_line_relation, intersection_line_line_2d, TOLERANCE
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -49,14 +49,20 @@ class ConstructionBox(ConstructionTool):
     def update(self) -> None:
         if not self._tainted:
             return
-        center = self.center
-        w2 = Vec2.from_deg_angle(self._angle, self._width / 2.)
-        h2 = Vec2.from_deg_angle(self._angle + 90, self._height / 2.)
+        cx, cy = self.center
+        # one sine/cosine pair: cos(angle + 90) = -sin(angle), sin(angle + 90) = cos(angle)
+        angle = math.radians(self._angle)
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        w2 = self._width / 2.
+        h2 = self._height / 2.
+        wx, wy = cos_a * w2, sin_a * w2
+        hx, hy = -sin_a * h2, cos_a * h2
         self._corners = (
-            center - w2 - h2,  # lower left
-            center + w2 - h2,  # lower right
-            center + w2 + h2,  # upper right
-            center - w2 + h2,  # upper left
+            Vec2(cx - wx - hx, cy - wy - hy),  # lower left
+            Vec2(cx + wx - hx, cy + wy - hy),  # lower right
+            Vec2(cx + wx + hx, cy + wy + hy),  # upper right
+            Vec2(cx - wx + hx, cy - wy + hy),  # upper left
         )
         self._tainted = False
 
@@ -240,9 +246,22 @@ class ConstructionBox(ConstructionTool):
             =========== ==================================
 
         """
-        result = set()
-        for border_line in self.border_lines():
-            p = line.intersect(border_line)
-            if p is not None:
-                result.add(p)
+        # intersect border lines as corner pairs, avoids creating 4 temporary ConstructionLine() objects
+        start, end = line.start, line.end
+        segment = (start, end)
+        p1, p2, p3, p4 = self.corners
+        # fast reject: line and box do not intersect if their axis aligned bounding boxes do not overlap,
+        # padded by the tolerance of intersection_line_line_2d() for points outside of a segment
+        xs = (p1.x, p2.x, p3.x, p4.x)
+        ys = (p1.y, p2.y, p3.y, p4.y)
+        pad = TOLERANCE / 2.
+        if (max(start.x, end.x) < min(xs) - pad or min(start.x, end.x) > max(xs) + pad or
+                max(start.y, end.y) < min(ys) - pad or min(start.y, end.y) > max(ys) + pad):
+            return []
+        result = []
+        for border_line in ((p1, p2), (p2, p3), (p3, p4), (p4, p1)):
+            p = intersection_line_line_2d(segment, border_line, virtual=False)
+            # a corner is found by two border lines, Vec2.__eq__() also detects nearly equal points
+            if p is not None and p not in result:
+                result.append(p)
         return sorted(result)
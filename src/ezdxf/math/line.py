@@ -145,6 +145,21 @@ class ConstructionRay:
         """ Returns orthogonal ray at `location`. """
         return ConstructionRay(location, angle=self._angle + HALF_PI)
 
+    def parallel(self, location: 'Vertex') -> 'ConstructionRay':
+        """ Returns parallel ray at `location`, reuses direction, angle and slope of `self`. """
+        ray = ConstructionRay.__new__(ConstructionRay)
+        ray._location = Vec2(location)
+        ray._angle = self._angle
+        ray._direction = self._direction
+        ray._slope = self._slope
+        if self._is_vertical:
+            ray._yof0 = None
+        else:
+            ray._yof0 = ray._location.y - self._slope * ray._location.x
+        ray._is_vertical = self._is_vertical
+        ray._is_horizontal = self._is_horizontal
+        return ray
+
     def yof(self, x: float) -> float:
         """ Returns y-value of ray for `x` location.
 
@@ -1,7 +1,7 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, List
 from .vector import Vector
 
 if TYPE_CHECKING:
@@ -35,6 +35,21 @@ class Matrix33:
         z = px * ux.z + py * uy.z + pz * uz.z
         return Vector(x, y, z)
 
+    def transform_vectors(self, vectors: Iterable['Vertex']) -> List[Vector]:
+        """ Returns a list of transformed vectors. """
+        result = []
+        ux_x, ux_y, ux_z = self.ux
+        uy_x, uy_y, uy_z = self.uy
+        uz_x, uz_y, uz_z = self.uz
+        for vector in vectors:
+            px, py, pz = Vector(vector)
+            result.append(Vector(
+                px * ux_x + py * uy_x + pz * uz_x,
+                px * ux_y + py * uy_y + pz * uz_y,
+                px * ux_z + py * uy_z + pz * uz_z,
+            ))
+        return result
+
     def determinant(self) -> float:
         """ Returns determinant. """
         e11, e12, e13 = self.ux
@@ -63,8 +63,10 @@ class OCS:
 
     def points_from_wcs(self, points: Iterable['Vertex']) -> Iterable['Vertex']:
         """ Returns iterable of OCS vectors from WCS `points`. """
-        for point in points:
-            yield self.from_wcs(point)
+        if self.transform:
+            yield from self.transpose.transform_vectors(points)
+        else:
+            yield from points
 
     def to_wcs(self, point: 'Vertex') -> 'Vertex':
         """ Returns WCS vector for OCS `point`. """
@@ -167,10 +169,7 @@ class TransformUSCToOCSMixin:
             points: iterable of UCS vertices
 
         """
-        wcs = self.to_wcs
-        ocs = OCS(self.uz)
-        for point in points:
-            yield ocs.from_wcs(wcs(point))
+        yield from OCS(self.uz).points_from_wcs(self.points_to_wcs(points))
 
     def angles_to_ocs_deg(self, angles: Iterable[float]) -> List[float]:
         """
@@ -316,8 +315,9 @@ class UCS(TransformUSCToOCSMixin):
 
     def points_to_wcs(self, points: Iterable['Vertex']) -> Iterable['Vector']:
         """ Returns iterable of WCS vectors for UCS `points`. """
-        for point in points:
-            yield self.to_wcs(point)
+        origin = self.origin
+        for vector in self.matrix.transform_vectors(points):
+            yield origin + vector
 
     def direction_to_wcs(self, vector: 'Vertex') -> 'Vector':
         """ Returns WCS direction for UCS `vector` without origin adjustment. """
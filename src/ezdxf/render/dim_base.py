@@ -1,7 +1,8 @@
 # Created: 28.12.2018
 # Copyright (c) 2018-2020, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Tuple, Iterable, Optional
+from typing import TYPE_CHECKING, Tuple, Iterable, Optional, Callable
+from functools import lru_cache
 from ezdxf.math import Vector, Vec2, ConstructionLine, ConstructionBox
 from ezdxf.math import UCS, PassTroughUCS, xround, Z_AXIS
 from ezdxf.lldxf import const
@@ -32,6 +33,16 @@ TOLERANCE_TEMPLATE1 = _TOLERANCE_COMMON + r"{tol}}}"
 TOLERANCE_TEMPLATE2 = _TOLERANCE_COMMON + r"\S{upr}^ {lwr};}}"
 LIMITS_TEMPLATE = r"{{\H{fac:.2f}x;\S{upr}^ {lwr};}}"
 
+# DIMSTYLE attributes used by BaseDimensionRenderer, fetched by one DimStyleOverride.bulk_get() call
+DIMSTYLE_ATTRIBS = (
+    'dimscale', 'dimcen', 'dimlfac', 'dimtxsty', 'dimtxt', 'dimgap', 'dimclrt', 'dimrnd', 'dimdec', 'dimzin',
+    'dimdsep', 'dimpost', 'dimtfill', 'dimtfillclr', 'dimjust', 'dimtad', 'dimtvp', 'dimtmove', 'dimtih', 'dimtoh',
+    'dimtix', 'dimatfit', 'dimlunit', 'dimfrac', 'dimaunit', 'dimtsz', 'dimasz', 'dimsoxd', 'dimclrd', 'dimdle',
+    'dimltype', 'dimlwd', 'dimsd1', 'dimsd2', 'dimtofl', 'dimclre', 'dimltex1', 'dimltex2', 'dimlwe', 'dimse1',
+    'dimse2', 'dimexe', 'dimexo', 'dimfxlon', 'dimfxl', 'dimtol', 'dimlim', 'dimtfac', 'dimtm', 'dimtp', 'dimtdec',
+    'dimtolj', 'dimtzin',
+)
+
 
 def OptionalVec2(v) -> Optional[Vec2]:
     if v is not None:
@@ -51,28 +62,58 @@ def sign_char(value: float) -> str:
 
 def format_text(value: float, dimrnd: float = None, dimdec: int = None, dimzin: int = 0, dimdsep: str = '.',
                 dimpost: str = '<>') -> str:
-    if dimrnd is not None:
-        value = xround(value, dimrnd)
+    if value == 0.:
+        # -0. == 0. would share a cache entry, but '{:f}'.format(-0.) -> '-0.000000'
+        return _format_text(value, dimrnd, dimdec, dimzin, dimdsep, dimpost)
+    return _cached_format_text(value, dimrnd, dimdec, dimzin, dimdsep, dimpost)
+
+
+def make_formatter(dimrnd: float = None, dimdec: int = None, dimzin: int = 0, dimdsep: str = '.',
+                   dimpost: str = '<>') -> Callable[[float], str]:
+    """
+    Returns a function to format measurement values, all formatting properties are evaluated only once.
 
+    """
+    # format spec for the builtin format(), no format string parsing by str.format()
     if dimdec is None:
-        fmt = "{:f}"
-        dimzin = dimzin | 8  # remove pending zeros for undefined decimal places, '{:f}'.format(0) -> '0.000000'
+        spec = "f"
+        dimzin = dimzin | 8  # remove pending zeros for undefined decimal places, format(0, 'f') -> '0.000000'
     else:
-        fmt = "{:." + str(dimdec) + "f}"
-    text = fmt.format(value)
-
+        spec = "." + str(dimdec) + "f"
     leading = bool(dimzin & 4)
     pending = bool(dimzin & 8)
-    text = suppress_zeros(text, leading, pending)
-    if dimdsep != '.':
-        text = text.replace('.', dimdsep)
+
     if dimpost:
-        if '<>' in dimpost:
-            fmt = dimpost.replace('<>', '{}', 1)
-            text = fmt.format(text)
-        else:
+        if '<>' not in dimpost:
             raise DXFValueError('Invalid dimpost string: "{}"'.format(dimpost))
-    return text
+        # DIMPOST template is compiled into prefix and suffix
+        prefix, suffix = dimpost.split('<>', 1)
+    else:
+        prefix, suffix = '', ''
+    replace_separator = dimdsep != '.'
+
+    def formatter(value: float) -> str:
+        if dimrnd is not None:
+            value = xround(value, dimrnd)
+        text = suppress_zeros(format(value, spec), leading, pending)
+        if replace_separator:
+            text = text.replace('.', dimdsep)
+        return prefix + text + suffix
+
+    return formatter
+
+
+# formatters are shared by all dimensions with the same formatting properties
+_cached_make_formatter = lru_cache(maxsize=256)(make_formatter)
+
+
+def _format_text(value: float, dimrnd: Optional[float], dimdec: Optional[int], dimzin: int, dimdsep: str,
+                 dimpost: str) -> str:
+    return _cached_make_formatter(dimrnd, dimdec, dimzin, dimdsep, dimpost)(value)
+
+
+# measurement values of dimensions repeat often, e.g. grid dimensions
+_cached_format_text = lru_cache(maxsize=4096)(_format_text)
 
 
 class BaseDimensionRenderer:
@@ -139,7 +180,8 @@ class BaseDimensionRenderer:
         # ignored by ezdxf
         self.horizontal_direction = self.dimension.get_dxf_attrib('horizontal_direction', None)  # type: bool
 
-        get = self.dim_style.get
+        # resolve all DIMSTYLE attributes at once, get(attribute, default) works like DimStyleOverride.get()
+        get = self.dim_style.bulk_get(DIMSTYLE_ATTRIBS).get
         # overall scaling of DIMENSION entity
         self.dim_scale = get('dimscale', 1)  # type: float
         if self.dim_scale == 0:
@@ -160,6 +202,11 @@ class BaseDimensionRenderer:
         self.text_style_name = get('dimtxsty', self.default_text_style())  # type: str
 
         self.text_style = self.drawing.styles.get(self.text_style_name)  # type: Style
+        # unscaled (self.dim_scale) character height defined by text style or DIMTXT,
+        # use self.text_height for proper scaled text height in drawing units
+        self.char_height = self.text_style.get_dxf_attrib('height', 0)  # type: float
+        if self.char_height == 0:  # variable text height (not fixed)
+            self.char_height = get('dimtxt', 1.)
         self.text_height = self.char_height * self.dim_scale  # type: float
         self.text_width_factor = self.text_style.get_dxf_attrib('width', 1.)  # type: float
         # text_gap: gap between dimension line an dimension text
@@ -179,11 +226,11 @@ class BaseDimensionRenderer:
         # 12 (Bit 3+4) = Suppresses both leading and trailing zeros (for example, 0.5000 becomes .5)
         self.text_suppress_zeros = get('dimzin', 0)  # type: int
 
-        dimdsep = self.dim_style.get('dimdsep', 0)
+        dimdsep = get('dimdsep', 0)
         self.text_decimal_separator = ',' if dimdsep == 0 else chr(dimdsep)  # type: str
-        self.text_format = self.dim_style.get('dimpost', '<>')  # type: str
-        self.text_fill = self.dim_style.get('dimtfill', 0)  # type: int # 0= None, 1=Background, 2=DIMTFILLCLR
-        self.text_fill_color = self.dim_style.get('dimtfillclr', 1)  # type: int
+        self.text_format = get('dimpost', '<>')  # type: str
+        self.text_fill = get('dimtfill', 0)  # type: int # 0= None, 1=Background, 2=DIMTFILLCLR
+        self.text_fill_color = get('dimtfillclr', 1)  # type: int
         self.text_box_fill_scale = 1.1
 
         # text_halign = 0: center; 1: left; 2: right; 3: above ext1; 4: above ext2
@@ -393,6 +440,9 @@ class BaseDimensionRenderer:
             self.tol_text_width = None  # requires actual measurement
             self.text_height = max(self.text_height, self.tol_text_height)
 
+        # width of a single character, text_height is final at this point
+        self.char_width = self.text_height * self.text_width_factor  # type: float
+
     def default_text_style(self):
         style = options.default_dimension_text_style
         if style not in self.drawing.styles:
@@ -412,25 +462,12 @@ class BaseDimensionRenderer:
             self.dim_tolerance = 0
             self.dim_limits = 0
 
-    @property
-    def char_height(self) -> float:
-        """
-        Unscaled (self.dim_scale) character height defined by text style or DIMTXT.
-        Hint: Use self.text_height for proper scaled text height in drawing units.
-
-        """
-        height = self.text_style.get_dxf_attrib('height', 0)  # type: float
-        if height == 0:  # variable text height (not fixed)
-            height = self.dim_style.get('dimtxt', 1.)
-        return height
-
     def text_width(self, text: str) -> float:
         """
         Return width of `text` in drawing units.
 
         """
-        char_width = self.text_height * self.text_width_factor  # type: float
-        return len(text) * char_width
+        return len(text) * self.char_width
 
     def tolerance_text_width(self, count: int) -> float:
         """
@@ -562,7 +599,8 @@ class BaseDimensionRenderer:
         """
 
         def add_line_to_block(start, end):
-            self.block.add_line(to_ocs(start).vec2, to_ocs(end).vec2, dxfattribs=dxfattribs)
+            start, end = points_to_ocs((start, end))
+            self.block.add_line(start.vec2, end.vec2, dxfattribs=dxfattribs)
 
         def order(a: Vec2, b: Vec2) -> Tuple[Vec2, Vec2]:
             if (start - a).magnitude < (start - b).magnitude:
@@ -570,10 +608,7 @@ class BaseDimensionRenderer:
             else:
                 return b, a
 
-        to_ocs = self.ucs.to_ocs
-        attribs = self.default_attributes()
-        if dxfattribs:
-            attribs.update(dxfattribs)
+        points_to_ocs = self.ucs.points_to_ocs
         text_box = self.text_box
         if remove_hidden_lines and (text_box is not None):
             start_inside = int(text_box.is_inside(start))
@@ -685,9 +720,10 @@ class BaseDimensionRenderer:
         attribs = {
             'layer': 'DEFPOINTS',
         }
-        for point in points:
-            location = self.ucs.to_ocs(point).replace(z=0)
-            self.block.add_point(location, dxfattribs=attribs)
+        add_point = self.block.add_point
+        # one OCS for all points, UCS.to_ocs() creates a new OCS for each point
+        for location in self.ucs.points_to_ocs(points):
+            add_point(location.replace(z=0), dxfattribs=attribs)
 
     def add_leader(self, p1: Vec2, p2: Vec2, p3: Vec2, dxfattribs: dict = None):
         """
@@ -706,6 +742,17 @@ class BaseDimensionRenderer:
     def transform_ucs_to_wcs(self) -> None:
         pass  # abstract method
 
+    def defpoints_to_wcs(self, names: Iterable[str]) -> None:
+        """
+        Transforms DIMENSION definition points `names` from UCS into WCS by one UCS.points_to_wcs() call.
+
+        """
+        dimension = self.dimension
+        names = tuple(names)
+        points = self.ucs.points_to_wcs([dimension.get_dxf_attrib(name) for name in names])
+        for name, point in zip(names, points):
+            dimension.set_dxf_attrib(name, point)
+
     @property
     def vertical_placement(self) -> float:
         """
@@ -13,6 +13,14 @@ from .dim_base import BaseDimensionRenderer, TextBox
 if TYPE_CHECKING:
     from ezdxf.eztypes import Dimension, Vertex, GenericLayoutType
 
+# bound once, used for every rendered dimension line
+_ARROWS_ORIGIN_ZERO = ARROWS.ORIGIN_ZERO
+_has_extension_line = ARROWS.has_extension_line
+
+
+def _has_arrow_extension(name: str) -> bool:
+    return (name is not None) and (name in ARROWS) and (name not in _ARROWS_ORIGIN_ZERO)
+
 
 def order_leader_points(p1: Vec2, p2: Vec2, p3: Vec2) -> Tuple[Vec2, Vec2]:
     if (p1 - p2).magnitude > (p1 - p3).magnitude:
@@ -21,6 +29,25 @@ def order_leader_points(p1: Vec2, p2: Vec2, p3: Vec2) -> Tuple[Vec2, Vec2]:
         return p2, p3
 
 
+def _normalize2d(dx: float, dy: float) -> Tuple[float, float]:
+    # same arithmetic as Vec2.normalize(), without the temporary Vec2 objects
+    factor = 1. / math.hypot(dx, dy)
+    return dx * factor, dy * factor
+
+
+def _unit_vector(angle: float) -> Vec2:
+    # exact axis directions for horizontal and vertical dimension lines, cos(pi/2) is not 0
+    x = math.cos(angle)
+    y = math.sin(angle)
+    return Vec2(0. if abs(x) < 1e-12 else x, 0. if abs(y) < 1e-12 else y)
+
+
+def _project_point(location: Vec2, direction: Vec2, point: Vec2) -> Vec2:
+    # projection of `point` onto the line through `location` with unit vector `direction`
+    t = (point.x - location.x) * direction.x + (point.y - location.y) * direction.y
+    return Vec2(location.x + direction.x * t, location.y + direction.y * t)
+
+
 class LinearDimension(BaseDimensionRenderer):
     """
     Linear dimension line renderer, used for horizontal, vertical, rotated and aligned DIMENSION entities.
@@ -52,16 +79,27 @@ class LinearDimension(BaseDimensionRenderer):
         self.ext1_line_start = Vec2(self.dimension.dxf.defpoint2)
         self.ext2_line_start = Vec2(self.dimension.dxf.defpoint3)
 
-        ext1_ray = ConstructionRay(self.ext1_line_start, angle=self.ext_line_angle_rad)
-        ext2_ray = ConstructionRay(self.ext2_line_start, angle=self.ext_line_angle_rad)
-        dim_line_ray = ConstructionRay(self.dimension.dxf.defpoint, angle=self.dim_line_angle_rad)
-
-        self.dim_line_start = dim_line_ray.intersect(ext1_ray)  # type: Vec2
-        self.dim_line_end = dim_line_ray.intersect(ext2_ray)  # type: Vec2
+        dim_line_location = Vec2(self.dimension.dxf.defpoint)
+        dim_line_direction = _unit_vector(self.dim_line_angle_rad)
+        if math.isclose(self.oblique_angle % 180., 90., abs_tol=1e-12):
+            # extension lines perpendicular to dimension line: project measurement points onto the dimension line
+            self.ext_line_direction = Vec2.from_angle(self.ext_line_angle_rad)  # type: Vec2
+            start = _project_point(dim_line_location, dim_line_direction, self.ext1_line_start)
+            end = _project_point(dim_line_location, dim_line_direction, self.ext2_line_start)
+            self.dim_line_start = start  # type: Vec2
+            self.dim_line_end = end  # type: Vec2
+        else:
+            ext1_ray = ConstructionRay(self.ext1_line_start, angle=self.ext_line_angle_rad)
+            ext2_ray = ext1_ray.parallel(self.ext2_line_start)
+            dim_line_ray = ConstructionRay(dim_line_location, angle=self.dim_line_angle_rad)
+            # unit vector in extension line direction
+            self.ext_line_direction = ext1_ray.direction  # type: Vec2
+            self.dim_line_start = dim_line_ray.intersect(ext1_ray)  # type: Vec2
+            self.dim_line_end = dim_line_ray.intersect(ext2_ray)  # type: Vec2
         self.dim_line_center = self.dim_line_start.lerp(self.dim_line_end)  # type: Vec2
 
         if self.dim_line_start == self.dim_line_end:
-            self.dim_line_vec = Vec2.from_angle(self.dim_line_angle_rad)
+            self.dim_line_vec = dim_line_direction
         else:
             self.dim_line_vec = (self.dim_line_end - self.dim_line_start).normalize()  # type: Vec2
 
@@ -86,6 +124,14 @@ class LinearDimension(BaseDimensionRenderer):
         self.required_arrows_space = 2 * self.arrow_size + self.text_gap  # type: float
         self.arrows_outside = self.required_arrows_space > self.measurement  # type: bool
 
+        # DXF attributes shared by all entities of the same kind, add_blockref() and layouts copy dxfattribs
+        self.arrow_attribs = {'color': self.dim_line_color}  # type: dict
+        self.dim_line_attribs = self.dim_line_attributes()  # type: dict
+        self.ext_line_attribs = {'color': self.ext_line_color}  # type: dict
+        if self.supports_dxf_r2000:  # lineweight requires DXF R2000 or later
+            self.ext_line_attribs['lineweight'] = self.ext_lineweight
+        self.text_attribs = {'color': self.text_color}  # type: dict
+
         # text location and rotation
         if self.text:
             # text width and required space
@@ -267,7 +313,7 @@ class LinearDimension(BaseDimensionRenderer):
             location = (start if halign == 3 else end) - hvec
             # vertical location
             vdist = self.ext_line_extension + self.dim_text_width / 2.
-            location += Vec2.from_deg_angle(self.ext_line_angle).normalize(vdist)
+            location += self.ext_line_direction.normalize(vdist)
         else:
             # relocate outside text to center location
             if self.text_outside:
@@ -298,9 +344,7 @@ class LinearDimension(BaseDimensionRenderer):
         Returns: dimension line connection points
 
         """
-        attribs = {
-            'color': self.dim_line_color,
-        }
+        attribs = self.arrow_attribs
         start = self.dim_line_start
         end = self.dim_line_end
         outside = self.arrows_outside
@@ -352,28 +396,26 @@ class LinearDimension(BaseDimensionRenderer):
         Add extension lines to arrows placed outside of dimension extension lines. Called by `self.add_arrows()`.
 
         """
-
-        def has_arrow_extension(name: str) -> bool:
-            return (name is not None) and (name in ARROWS) and (name not in ARROWS.ORIGIN_ZERO)
-
-        attribs = {
-            'color': self.dim_line_color,
-        }
+        attribs = self.arrow_attribs
         start = self.dim_line_start
         end = self.dim_line_end
         arrow_size = self.arrow_size
 
-        if not self.suppress_arrow1 and has_arrow_extension(self.arrow1_name):
+        ux, uy = self.dim_line_vec
+        dx, dy = ux * arrow_size, uy * arrow_size
+        dx2, dy2 = ux * (2 * arrow_size), uy * (2 * arrow_size)
+
+        if not self.suppress_arrow1 and _has_arrow_extension(self.arrow1_name):
             self.add_line(
-                start - self.dim_line_vec * arrow_size,
-                start - self.dim_line_vec * (2 * arrow_size),
+                Vec2(start.x - dx, start.y - dy),
+                Vec2(start.x - dx2, start.y - dy2),
                 dxfattribs=attribs,
             )
 
-        if not self.suppress_arrow2 and has_arrow_extension(self.arrow2_name):
+        if not self.suppress_arrow2 and _has_arrow_extension(self.arrow2_name):
             self.add_line(
-                end + self.dim_line_vec * arrow_size,
-                end + self.dim_line_vec * (2 * arrow_size),
+                Vec2(end.x + dx, end.y + dy),
+                Vec2(end.x + dx2, end.y + dy2),
                 dxfattribs=attribs,
             )
 
@@ -387,10 +429,7 @@ class LinearDimension(BaseDimensionRenderer):
             rotation: text rotation in degrees
 
         """
-        attribs = {
-            'color': self.text_color,
-        }
-        self.add_text(dim_text, pos=Vector(pos), rotation=rotation, dxfattribs=attribs)
+        self.add_text(dim_text, pos=Vector(pos), rotation=rotation, dxfattribs=self.text_attribs)
 
     def add_dimension_line(self, start: 'Vertex', end: 'Vertex') -> None:
         """
@@ -402,13 +441,14 @@ class LinearDimension(BaseDimensionRenderer):
             end: dimension line end
 
         """
-        extension = self.dim_line_vec * self.dim_line_extension
-        if self.arrow1_name is None or ARROWS.has_extension_line(self.arrow1_name):
-            start = start - extension
-        if self.arrow2_name is None or ARROWS.has_extension_line(self.arrow2_name):
-            end = end + extension
+        extension = self.dim_line_extension
+        ex, ey = self.dim_line_vec.x * extension, self.dim_line_vec.y * extension
+        if self.arrow1_name is None or _has_extension_line(self.arrow1_name):
+            start = Vec2(start.x - ex, start.y - ey)
+        if self.arrow2_name is None or _has_extension_line(self.arrow2_name):
+            end = Vec2(end.x + ex, end.y + ey)
 
-        attribs = self.dim_line_attributes()
+        attribs = self.dim_line_attribs
 
         if self.suppress_dim1_line or self.suppress_dim2_line:
             # TODO: results not as expected, but good enough
@@ -434,17 +474,19 @@ class LinearDimension(BaseDimensionRenderer):
 
         """
         if start == end:
-            direction = Vec2.from_deg_angle(self.ext_line_angle)
+            ux, uy = self.ext_line_direction
         else:
-            direction = (end - start).normalize()
+            ux, uy = _normalize2d(end.x - start.x, end.y - start.y)
         if self.ext_line_fixed:
-            start = end - (direction * self.ext_line_length)
+            length = self.ext_line_length
+            start = Vec2(end.x - ux * length, end.y - uy * length)
         else:
-            start = start + direction * self.ext_line_offset
+            offset = self.ext_line_offset
+            start = Vec2(start.x + ux * offset, start.y + uy * offset)
         extension = self.ext_line_extension
         if text_above_extline:
             extension += self.dim_text_width
-        end = end + direction * extension
+        end = Vec2(end.x + ux * extension, end.y + uy * extension)
         return start, end
 
     def add_extension_line(self, start: 'Vertex', end: 'Vertex', linetype: str = None) -> None:
@@ -452,16 +494,9 @@ class LinearDimension(BaseDimensionRenderer):
         Add extension lines from dimension line to measurement point.
 
         """
-        attribs = {
-            'color': self.ext_line_color
-        }
+        attribs = self.ext_line_attribs
         if linetype is not None:
-            attribs['linetype'] = linetype
-
-        # lineweight requires DXF R2000 or later
-        if self.supports_dxf_r2000:
-            attribs['lineweight'] = self.ext_lineweight
-
+            attribs = dict(attribs, linetype=linetype)
         self.add_line(start, end, dxfattribs=attribs)
 
     def transform_ucs_to_wcs(self) -> None:
@@ -476,9 +511,7 @@ class LinearDimension(BaseDimensionRenderer):
             point = self.dimension.get_dxf_attrib(attr)
             self.dimension.set_dxf_attrib(attr, func(point))
 
-        from_ucs('defpoint', self.ucs.to_wcs)
-        from_ucs('defpoint2', self.ucs.to_wcs)
-        from_ucs('defpoint3', self.ucs.to_wcs)
+        self.defpoints_to_wcs(('defpoint', 'defpoint2', 'defpoint3'))
         from_ucs('text_midpoint', self.ucs.to_ocs)
         self.dimension.dxf.angle = self.ucs.to_ocs_angle_deg(self.dimension.dxf.angle)
 
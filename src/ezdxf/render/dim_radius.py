@@ -360,8 +360,7 @@ class RadiusDimension(BaseDimensionRenderer):
             point = self.dimension.get_dxf_attrib(attr)
             self.dimension.set_dxf_attrib(attr, func(point))
 
-        from_ucs('defpoint', self.ucs.to_wcs)
-        from_ucs('defpoint4', self.ucs.to_wcs)
+        self.defpoints_to_wcs(('defpoint', 'defpoint4'))
         from_ucs('text_midpoint', self.ucs.to_ocs)
         if self.requires_extrusion:
             self.dimension.dxf.extrusion = self.ucs.uz
@@ -15,24 +15,25 @@ if TYPE_CHECKING:
 
 
 class DimensionRenderer:
+    # dimension type -> name of renderer method, looked up by name to support overriding in subclasses
+    _DISPATCH = {
+        0: 'linear',
+        1: 'linear',
+        2: 'angular',
+        3: 'diameter',
+        4: 'radius',
+        5: 'angular3p',
+        6: 'ordinate',
+    }
+
     def dispatch(self, override: 'DimStyleOverride', ucs: 'UCS') -> 'BaseDimensionRenderer':
         dimension = override.dimension
         dim_type = dimension.dimtype
-
-        if dim_type in (0, 1):
-            return self.linear(dimension, ucs, override)
-        elif dim_type == 2:
-            return self.angular(dimension, ucs, override)
-        elif dim_type == 3:
-            return self.diameter(dimension, ucs, override)
-        elif dim_type == 4:
-            return self.radius(dimension, ucs, override)
-        elif dim_type == 5:
-            return self.angular3p(dimension, ucs, override)
-        elif dim_type == 6:
-            return self.ordinate(dimension, ucs, override)
-        else:
+        try:
+            method_name = self._DISPATCH[dim_type]
+        except KeyError:
             raise DXFValueError(f'Unknown DIMENSION type: {dim_type}')
+        return getattr(self, method_name)(dimension, ucs, override)
 
     def linear(self, dimension: 'Dimension', ucs: 'UCS', override: 'DimStyleOverride' = None):
         """ Call renderer for linear dimension lines: horizontal, vertical and rotated """
@@ -152,6 +152,8 @@ class AcDsData:
 
 
 class Section(Tags):
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return self[0].value
@@ -2,7 +2,7 @@
 # Copyright (c) 2011-2018, Manfred Moitzi
 # License: MIT License
 from typing import TYPE_CHECKING, Iterator, Iterable, Union, cast
-from collections import Counter, OrderedDict
+from collections import OrderedDict
 
 from ezdxf.lldxf.const import DXFStructureError, DXF2004, DXF2000, DXFKeyError
 from ezdxf.entities.dxfclass import DXFClass
@@ -198,10 +198,6 @@ class ClassesSection:
         """ Update CLASS instance counter for all registered classes, requires DXF R2004 or later. """
         if self.doc.dxfversion < DXF2004:
             return  # instance counter not supported
-        counter = Counter()
-        # count all entities in the entity database
-        for entity in self.doc.entitydb.values():
-            counter[entity.dxftype()] += 1
-
+        entitydb = self.doc.entitydb
         for dxfclass in self.classes.values():
-            dxfclass.dxf.instance_count = counter[dxfclass.dxf.name]
+            dxfclass.dxf.instance_count = entitydb.count_dxftype(dxfclass.dxf.name)
@@ -73,9 +73,7 @@ class ObjectsSection:
 
     def delete_all_entities(self) -> None:
         """ Delete all DXF objects. (internal API) """
-        db = self.entitydb
-        for entity in self._entity_space:
-            db.delete_entity(entity)
+        self.entitydb.delete_entities(self._entity_space)
         self._entity_space.clear()
 
     def setup_rootdict(self) -> Dictionary:
@@ -1,7 +1,7 @@
 # Created: 12.03.2011, 2018 rewritten for pytest
 # Copyright (C) 2011-2019, Manfred Moitzi
 # License: MIT License
-from ezdxf.tools.handle import HandleGenerator
+from ezdxf.tools.handle import HandleGenerator, ImageKeyGenerator
 
 
 def test_next():
@@ -24,3 +24,21 @@ def test_reset():
     handles = HandleGenerator('200')
     handles.reset('300')
     assert '300' == str(handles)
+
+
+def test_next_batch():
+    handles = HandleGenerator('FE')
+    assert handles.next_batch(3) == ['FE', 'FF', '100']
+    assert '101' == str(handles)
+
+
+def test_next_batch_of_key_generator():
+    keys = ImageKeyGenerator('1')
+    assert keys.next_batch(2) == ['Image00001', 'Image00002']
+    assert 'Image00003' == keys.next()
+
+
+def test_iterator_protocol():
+    handles = HandleGenerator('A')
+    assert next(filter(lambda h: h != 'A', handles)) == 'B'
+    assert 'C' == str(handles)
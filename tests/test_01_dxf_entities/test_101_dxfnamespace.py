@@ -204,6 +204,21 @@ def test_load_doublettes():
     assert ns.test3 == '3'
 
 
+def test_loaded_owner_handles_are_shared():
+    ns1 = DXFNamespace(SubclassProcessor(ExtendedTags.from_text(TEST_1)))
+    ns2 = DXFNamespace(SubclassProcessor(ExtendedTags.from_text(TEST_1)))
+    assert ns1.owner is ns2.owner
+
+
+def test_processor_handle(processor):
+    assert processor.handle == 'FFFF'
+
+
+def test_processor_without_handle():
+    processor = SubclassProcessor(ExtendedTags.from_text("0\nCLASS\n1\nACDBPLACEHOLDER\n"))
+    assert processor.handle == '<?>'
+
+
 TEST_1 = """0
 DXFENTITY
 5
@@ -8,7 +8,7 @@ from ezdxf.math import Vector
 from ezdxf.entities.dimension import Dimension, linear_measurement
 from ezdxf.lldxf.const import DXF12, DXF2000
 from ezdxf.lldxf.tagwriter import TagCollector, basic_tags_from_text
-from ezdxf.render.dim_base import format_text, DXFValueError
+from ezdxf.render.dim_base import format_text, make_formatter, DXFValueError
 
 TEST_CLASS = Dimension
 TEST_TYPE = 'DIMENSION'
@@ -204,6 +204,23 @@ def test_format_text():
         _ = format_text(-0.51, dimpost='<')
 
 
+def test_format_text_cache():
+    assert format_text(1.5, dimdec=2, dimpost='<> mm') == '1.50 mm'
+    assert format_text(1.5, dimdec=2, dimpost='<> mm') == '1.50 mm'
+    assert format_text(1.5, dimdec=2, dimpost='<> m') == '1.50 m'
+    # -0. and 0. are equal as cache keys, but not as formatted text
+    assert format_text(0., dimdec=1) == '0.0'
+    assert format_text(-0., dimdec=1) == '-0.0'
+
+
+def test_make_formatter():
+    formatter = make_formatter(dimrnd=0.5, dimdec=2, dimzin=8, dimdsep=',', dimpost='{<>} mm')
+    assert formatter(10.51) == '{10,5} mm'
+    assert formatter(0.26) == '{0,5} mm'
+    with pytest.raises(DXFValueError):
+        make_formatter(dimpost='mm')
+
+
 def test_linear_measurement_without_ocs():
     measurement = linear_measurement(Vector(0, 0, 0), Vector(1, 0, 0))
     assert measurement == 1
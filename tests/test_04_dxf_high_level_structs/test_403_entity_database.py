@@ -9,6 +9,10 @@ ENTITY = DXFEntity.from_text("0\nTEST\n5\nFFFF\n")
 auditor = Auditor(None)
 
 
+def make_entities(*handles):
+    return [DXFEntity.from_text(f"0\nTEST\n5\n{handle}\n") for handle in handles]
+
+
 @pytest.fixture
 def db():
     db = EntityDB()
@@ -110,3 +114,81 @@ def test_restore_integrity_remove_invalid_handle():
     e.dxf.handle = 'XFFF'
     db.audit(auditor)
     assert len(db) == 0
+
+
+def test_extend():
+    db = EntityDB()
+    entities = make_entities('A1', 'A2', 'A3')
+    db.extend(entities)
+    assert len(db) == 3
+    assert db['A2'] is entities[1]
+
+
+def test_next_handle_with_untrusted_handle_seed():
+    db = EntityDB()
+    db.extend(make_entities('A', 'B', 'C'))
+    db.handles.reset('A')
+    assert db.next_handle() == 'D'
+    assert db.next_handle() == 'E'
+
+
+def test_extend_reserves_handles_in_one_batch():
+    db = EntityDB()
+    db.extend(make_entities('A', 'B', 'C'))
+    db.handles.reset('B')  # untrusted $HANDSEED
+    entities = [DXFEntity(), DXFEntity()]
+    db.extend(entities)
+    assert [e.dxf.handle for e in entities] == ['D', 'E']
+    assert db['E'] is entities[1]
+
+
+def test_extend_mixed_entities_with_and_without_handles():
+    db = EntityDB()
+    db.handles.reset('A')
+    entities = make_entities('A') + [DXFEntity()]
+    db.extend(entities)
+    assert len(db) == 2
+    assert entities[0].dxf.handle == 'A'
+    assert entities[1].dxf.handle == 'B'
+    assert db['A'] is entities[0]
+    assert db['B'] is entities[1]
+
+
+def test_by_dxftype():
+    db = EntityDB()
+    db.extend(make_entities('A1', 'A2', 'A3'))
+    assert len(db.by_dxftype('DXFENTITY')) == 3
+    assert db.by_dxftype('LINE') == []
+
+    del db['A2']
+    assert set(e.dxf.handle for e in db.by_dxftype('DXFENTITY')) == {'A1', 'A3'}
+
+
+def test_count_dxftype():
+    db = EntityDB()
+    db.extend(make_entities('A1', 'A2', 'A3'))
+    assert db.count_dxftype('DXFENTITY') == 3
+    assert db.count_dxftype('LINE') == 0
+    del db['A2']
+    assert db.count_dxftype('DXFENTITY') == 2
+
+
+def test_delete_entities():
+    db = EntityDB()
+    entities = make_entities('A1', 'A2', 'A3')
+    db.extend(entities)
+    db.delete_entities(entities[:2])
+    assert list(db.keys()) == ['A3']
+    assert entities[0].is_alive is False
+    assert entities[2].is_alive is True
+
+
+def test_duplicate_entity():
+    db = EntityDB()
+    db.handles.reset('100')
+    e = DXFEntity.from_text("0\nTEST\n5\nABBA\n")
+    db.add(e)
+    copy = db.duplicate_entity(e)
+    assert copy is not e
+    assert copy.dxf.handle == '100'
+    assert db['100'] is copy
@@ -20,7 +20,7 @@ center point, (-5.53851623, 8.87677359, 5.87096886)
 Extrusion direction relative to UCS: X=0.70819791  Y=0.07548520  Z=0.70196702
 
 """
-from ezdxf.math import OCS, Matrix44, Matrix33
+from ezdxf.math import OCS, Matrix44, Matrix33, Vector
 
 EXTRUSION = (0.7081979129501316, 0.0754851955385861, 0.7019670229772758)
 
@@ -105,3 +105,9 @@ def test_matrix44_to_wcs():
 def test_matrix33_determinant():
     m = Matrix33((1, 14, 31), (2, -6, -1), (0, 8, 15))
     assert m.determinant() == -6
+
+
+def test_matrix33_transform_vectors():
+    m = Matrix33((1, 14, 31), (2, -6, -1), (0, 8, 15))
+    points = [(1, 2, 3), (-4, 5), Vector(9, 8, 7)]
+    assert m.transform_vectors(points) == [m.transform(p) for p in points]
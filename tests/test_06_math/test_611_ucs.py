@@ -86,6 +86,14 @@ def test_to_ocs():
     assert ucs.to_ocs((1, 0, 0)).isclose((0, -1, 0))
 
 
+def test_points_to_wcs():
+    ucs = UCS.from_x_axis_and_point_in_xy(origin=(1, 2, 3), axis=(2, 3, 4), point=(3, 2, 5))
+    points = [(1, 2, 3), (4, 5, 6), (9, 8), Vector(1, 0, 3)]
+    expected = [ucs.to_wcs(p) for p in points]
+    result = list(ucs.points_to_wcs(points))
+    assert result == expected
+
+
 def test_points_to_ocs():
     ucs = UCS(ux=(0, 0, -1), uz=(1, 0, 0))
     points = [(1, 2, 3), (4, 5, 6), (9, 8, 7)]
@@ -105,6 +105,20 @@ class TestConstructionRay:
         point = ray.intersect(ortho)
         assert point.isclose(Vector(3, 10))
 
+    def test_parallel(self):
+        ray = ConstructionRay((-10, 3), (17, -7))
+        parallel = ray.parallel((3, 3))
+        assert parallel.location == (3, 3)
+        assert parallel.angle == ray.angle
+        assert parallel.is_parallel(ray)
+        assert math.isclose(parallel.yof(4), 3 + ray.slope)
+
+    def test_parallel_vertical(self):
+        ray = ConstructionRay((10, 1), (10, -7))
+        parallel = ray.parallel((3, 3))
+        assert parallel.is_vertical is True
+        assert parallel.xof(7) == 3
+
     def test_ray2d_angle(self):
         ray = ConstructionRay((10, 10), angle=HALF_PI)
         assert ray._is_vertical is True
@@ -2,7 +2,7 @@
 # Created: 29.01.2019
 # License: MIT License
 import math
-from ezdxf.math import ConstructionBox, ConstructionLine
+from ezdxf.math import ConstructionBox, ConstructionLine, Vec2
 
 
 class TestTextBox:
@@ -123,6 +123,21 @@ class TestTextBox:
         line = ConstructionLine((0, 2), (1, 2))  # above box
         assert len(box.intersect(line)) == 0
 
+    def test_intersect_0_overlapping_bounding_boxes(self):
+        box = ConstructionBox(center=(0, 0), width=2, height=2, angle=45)
+        # passes the rotated box at the corner of its bounding box
+        line = ConstructionLine((0.8, 1.4), (1.4, 0.8))
+        assert len(box.intersect(line)) == 0
+
+    def test_intersect_1_within_tolerance(self):
+        box = ConstructionBox(center=(0, 0), width=2, height=2, angle=45)
+        top = max(box.corners, key=lambda p: p.y)
+        start = top + Vec2(0, 2e-13)  # outside of bounding box, but within intersection tolerance
+        line = ConstructionLine(start, (top.x, top.y + 5))
+        result = box.intersect(line)
+        assert len(result) == 1
+        assert result[0].isclose(top)
+
     def test_intersect_1(self):
         box = ConstructionBox(center=(5, 0.5), width=10, height=1, angle=0)
         line = ConstructionLine((10, 1), (11, 2))  # touch one corner
@@ -130,6 +145,16 @@ class TestTextBox:
         assert len(result) == 1
         assert result[0] == (10, 1)
 
+    def test_intersect_1_rotated_box(self):
+        box = ConstructionBox(center=(5, 0.5), width=10, height=1, angle=1)
+        corner = box[2]
+        direction = Vec2.from_deg_angle(46)
+        line = ConstructionLine(corner - direction, corner + direction)  # touch one corner
+        result = box.intersect(line)
+        # border lines calculate slightly different corner locations
+        assert len(result) == 1
+        assert result[0].isclose(corner)
+
     def test_intersect_2(self):
         box = ConstructionBox(center=(5, 0.5), width=10, height=1, angle=0)
         line = ConstructionLine((5, -1), (5, 2))
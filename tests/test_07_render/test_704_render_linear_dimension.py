@@ -1,10 +1,13 @@
 # Copyright (c) 2019 Manfred Moitzi
 # License: MIT License
 
+import math
 import ezdxf
 import pytest
 
-from ezdxf.render.dimension import LinearDimension, DimStyleOverride
+from ezdxf.math import ConstructionRay
+from ezdxf.render.dimension import LinearDimension, DimStyleOverride, DimensionRenderer
+from ezdxf.lldxf.const import DXFValueError
 
 
 @pytest.fixture(scope='module')
@@ -75,3 +78,34 @@ def test_linear_dimension_with_limits(dwg):
     assert renderer.compile_mtext() == r"{\H0.50x;\S101.0200^ 100.9700;}"
 
 
+def test_dimstyle_override_bulk_get(dwg):
+    msp = dwg.modelspace()
+    dimline = msp.add_linear_dim(base=(0, 10), p1=(0, 0), p2=(101, 0), dimstyle='EZDXF')
+    style = DimStyleOverride(dimline.dimension, {'dimtp': 0.02})
+    attribs = style.bulk_get(['dimtp', 'dimasz', 'dimtm', 'dimblk'])
+    assert attribs['dimtp'] == 0.02  # override
+    assert attribs['dimasz'] == style.get('dimasz')  # from DIMSTYLE
+    for name in ('dimtm', 'dimblk'):
+        assert attribs.get(name, 'default') == style.get(name, 'default')
+
+
+@pytest.mark.parametrize('angle, oblique', [(0, 90), (90, 90), (30, 90), (30, 270), (30, 60)])
+def test_dimension_line_points(dwg, angle, oblique):
+    msp = dwg.modelspace()
+    dimline = msp.add_linear_dim(base=(3, 10), p1=(1, 2), p2=(7, -5), angle=angle)
+    dimline.dimension.dxf.oblique_angle = oblique
+    renderer = LinearDimension(dimline.dimension, override=DimStyleOverride(dimline.dimension))
+    dim_line_ray = ConstructionRay((3, 10), angle=math.radians(angle))
+    ext_line_angle = math.radians(angle + oblique)
+    assert renderer.dim_line_start.isclose(dim_line_ray.intersect(ConstructionRay((1, 2), angle=ext_line_angle)))
+    assert renderer.dim_line_end.isclose(dim_line_ray.intersect(ConstructionRay((7, -5), angle=ext_line_angle)))
+
+
+@pytest.mark.parametrize('dimtype, error', [(2, NotImplementedError), (7, DXFValueError)])
+def test_dimension_renderer_dispatch_errors(dwg, dimtype, error):
+    msp = dwg.modelspace()
+    dimline = msp.add_linear_dim(base=(0, 10), p1=(0, 0), p2=(100, 0))
+    dimline.dimension.dxf.dimtype = dimtype
+    style = DimStyleOverride(dimline.dimension)
+    with pytest.raises(error):
+        DimensionRenderer().dispatch(style, ucs=None)